@@ -1,19 +1,44 @@
 import json
+import os
 import time
-import datetime
+from email.utils import parsedate_to_datetime
+from bisect import bisect_right
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from clock import Clock
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
 # Constants
 PUSH_URL = 'https://api.pushover.net:443/1/messages.json'
 AURORA_URL = 'https://services.swpc.noaa.gov/json/ovation_aurora_latest.json'
 K_INDEX_URL = 'https://services.swpc.noaa.gov/json/planetary_k_index_1m.json'
-SECOND, MINUTE, HOUR = 1, 60, 3600
+SECOND, MINUTE, HOUR, DAY = 1, 60, 3600, 86400
 SEND_DELAY, SEND_DELAY_DAY = HOUR, 4 * HOUR
 CHECK_DELAY = MINUTE
-START_DAY, END_DAY = datetime.time(6, 0), datetime.time(19, 0)
+AURORA_TTL, K_INDEX_TTL = 5 * MINUTE, CHECK_DELAY - 5 * SECOND
+TIMEOUT = (3.05, 10)
+K_INDEX_TAIL = 2048
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'aurora')
+STATE_FILE = os.path.join(CACHE_DIR, 'state.json')
+PUSH_RATE_LIMIT, PUSH_RATE_WINDOW = 5, MINUTE
+DEDUP_WINDOW = 30 * MINUTE
+PUSH_DEBOUNCE = 5 * SECOND
+PUSH_RETRY_DELAY = MINUTE
+PUSH_QUEUE_LIMIT = 4
+START_DAY, END_DAY = 6 * HOUR, 19 * HOUR
 CHECK_EVENT = 1
 RESET_EVENT = 2
+DAYTIME_EVENT = 3
+PUSH_EVENT = 4
+MIN_SLEEP = 0.1
 AURORA_LEVELS = {
     'pl': [
         (90, 'Lokalnie: 90. Masz ją nad głową!'),
@@ -45,7 +70,8 @@ K_INDEX_LEVELS = {
         (5, 'Globally: 5. There might be a chance today.')
     ]
 }
-HEADERS = {'Content-type': 'application/x-www-form-urlencoded'}
+POOL_SIZE = 4
+RETRY = Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
 
 
 class Aurora:
@@ -71,13 +97,40 @@ class Aurora:
     :type clock: Clock
     :ivar is_day: Indicates whether the current time is within daytime hours.
     :type is_day: bool
-    :ivar last_send_time: Timestamp of the last sent push notification.
-    :type last_send_time: int
+    :ivar last_send_time: Unix timestamp of the last sent push notification.
+    :type last_send_time: float
     :ivar last_k_level: Last K-index level of geomagnetic activity recorded.
     :type last_k_level: int
     :ivar last_aurora_level: Last aurora activity level recorded.
     :type last_aurora_level: int
+    :ivar session: Shared HTTP session keeping pooled connections alive between checks.
+    :type session: requests.Session
+    :ivar executor: Thread pool downloading the aurora and K-index data concurrently.
+    :type executor: ThreadPoolExecutor
+    :ivar cache: Last responses keyed by URL, stored as (clock fetch time, ETag, Last-Modified, parsed JSON).
+    :type cache: dict[str, tuple[float, str | None, str | None, any]]
+    :ivar location: The monitored (longitude, latitude) pair, as used in the aurora data.
+    :type location: tuple[int, int]
+    :ivar aurora_result: Last aurora JSON data paired with its (local, max) aurora values.
+    :type aurora_result: tuple[any, tuple[int, int]] | None
+    :ivar push_times: Clock times of push notifications sent within the last `PUSH_RATE_WINDOW` seconds.
+    :type push_times: deque[float]
+    :ivar push_cooldown_until: Clock time before which no push notification is sent.
+    :type push_cooldown_until: float
+    :ivar recent_messages: Messages sent within the last `DEDUP_WINDOW` seconds mapped to their Unix send time.
+    :type recent_messages: dict[str, float]
+    :ivar pending_messages: Messages waiting to be sent together in one push notification.
+    :type pending_messages: list[str]
+    :ivar aurora_levels: Aurora thresholds for the configured language, paired as (ascending levels, messages).
+    :type aurora_levels: tuple[tuple[int, ...], tuple[str, ...]]
+    :ivar k_levels: K-index thresholds for the configured language, paired as (ascending levels, messages).
+    :type k_levels: tuple[tuple[int, ...], tuple[str, ...]]
     """
+    __slots__ = ('api_key', 'user_key', 'latitude', 'longitude', 'language', 'clock', 'is_day', 'last_send_time',
+                 'last_k_level', 'last_aurora_level', 'session', 'executor', 'cache', 'location', 'aurora_result',
+                 'push_times', 'push_cooldown_until', 'recent_messages', 'pending_messages', 'aurora_levels',
+                 'k_levels')
+
     def __init__(self, api_key: str, user_key: str, latitude: int, longitude: int, language: str = 'pl'):
         self.api_key = api_key
         self.user_key = user_key
@@ -89,6 +142,78 @@ class Aurora:
         self.last_send_time = 0
         self.last_k_level = 0
         self.last_aurora_level = 0
+        self.session = self._create_session()
+        self.executor = ThreadPoolExecutor(max_workers=2)
+        self.cache: dict[str, tuple[float, str | None, str | None, any]] = {}
+        self.location = (longitude, latitude)
+        self.aurora_result: tuple[any, tuple[int, int]] | None = None
+        self.push_times: deque[float] = deque()
+        self.push_cooldown_until = 0
+        self.recent_messages: dict[str, float] = {}
+        self.pending_messages: list[str] = []
+        self.aurora_levels = self._sort_levels(AURORA_LEVELS[language])
+        self.k_levels = self._sort_levels(K_INDEX_LEVELS[language])
+        self.load_state()
+
+    def load_state(self) -> None:
+        """
+        Restores the tracked levels and recently sent messages saved by `save_state`.
+
+        The state is only restored if the last notification was sent within the reset period
+        (`SEND_DELAY_DAY` during the day, `SEND_DELAY` otherwise), so a restart during a storm
+        does not send the same messages again. Otherwise, or if the state file is missing or
+        invalid, the defaults are kept.
+
+        :return: None
+        """
+        try:
+            with open(STATE_FILE, 'rb') as file:
+                state = json_loads(file.read())
+        except (OSError, ValueError):
+            return
+        if time.time() - state.get('last_send_time', 0) >= self._reset_delay(self.is_daytime):
+            return
+        self.last_aurora_level = state.get('last_aurora_level', 0)
+        self.last_k_level = state.get('last_k_level', 0)
+        self.last_send_time = state.get('last_send_time', 0)
+        self.recent_messages = state.get('recent_messages', {})
+
+    @staticmethod
+    def _reset_delay(is_day: bool) -> int:
+        """Return the period of the reset event for daytime or nighttime."""
+        return SEND_DELAY_DAY if is_day else SEND_DELAY
+
+    def save_state(self) -> None:
+        """
+        Saves the tracked levels and recently sent messages to `STATE_FILE`.
+
+        :return: None
+        """
+        state = {
+            'last_aurora_level': self.last_aurora_level,
+            'last_k_level': self.last_k_level,
+            'last_send_time': self.last_send_time,
+            'recent_messages': self.recent_messages
+        }
+        self._save_file(STATE_FILE, json.dumps(state).encode())
+
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """
+        Creates an HTTP session shared by all outbound requests.
+
+        The session keeps connections to NOAA and Pushover alive between checks, so the
+        TCP and TLS handshakes are not repeated every minute. Failed requests are retried
+        with an exponential backoff.
+
+        :return: A configured session with a pooled, retrying HTTPS adapter.
+        :rtype: requests.Session
+        """
+        session = requests.Session()
+        session.headers.update({'Connection': 'keep-alive'})
+        adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, max_retries=RETRY)
+        session.mount('https://', adapter)
+        return session
 
     def update_daytime_delay(self):
         """
@@ -99,6 +224,8 @@ class Aurora:
         `is_daytime` and sets an appropriate delay for resetting an event. The
         delay is determined by whether it is daytime or not, using predefined
         constants `SEND_DELAY_DAY` for daytime and `SEND_DELAY` for non-daytime.
+        The method runs as a clock event, so it reschedules itself for the next
+        sunrise or sunset boundary.
 
         :raises ValueError: If the method fails to update the clock with an invalid
                             or undefined delay.
@@ -106,8 +233,28 @@ class Aurora:
         """
         if self.is_daytime != self.is_day:
             self.is_day = self.is_daytime
-            delay = SEND_DELAY_DAY if self.is_day else SEND_DELAY
-            self.clock.set(RESET_EVENT, delay)
+            self.clock.set(RESET_EVENT, self._reset_delay(self.is_day))
+        self.clock.set(DAYTIME_EVENT, self._seconds_to_daytime_change())
+
+    @staticmethod
+    def _seconds_since_midnight() -> int:
+        """Return the number of seconds elapsed since local midnight."""
+        now = time.localtime()
+        return now.tm_hour * HOUR + now.tm_min * MINUTE + now.tm_sec
+
+    def _seconds_to_daytime_change(self) -> int:
+        """
+        Calculates the number of seconds until the next `START_DAY` or `END_DAY` boundary.
+
+        :return: The number of seconds until the daytime status changes, always at least 1.
+        :rtype: int
+        """
+        seconds = self._seconds_since_midnight()
+        if seconds < START_DAY:
+            return START_DAY - seconds
+        if seconds <= END_DAY:
+            return END_DAY - seconds + 1
+        return DAY - seconds + START_DAY
 
     def check(self):
         """
@@ -116,7 +263,11 @@ class Aurora:
 
         This method checks the current aurora level and K-index level, compares them with the
         previous recorded levels, and logs the relevant information. If a significant change
-        or condition is detected, it generates a notification message and sends it.
+        or condition is detected, it generates a notification message and queues it for sending
+        (see `queue_push`). Both data sets are downloaded concurrently.
+
+        If a download fails with no earlier data to fall back on, or the data cannot be
+        processed, the error is logged and the check is skipped.
 
         :raises: This method does not raise any specific exception.
         :return: A notification message containing updates on aurora or K-index levels if
@@ -124,22 +275,33 @@ class Aurora:
         :rtype: str
         """
         print(f'{time.strftime("%H:%M")}; ', end='')
-        aurora_result = self._evaluate_aurora_level()
-        k_index_result = self._evaluate_k_index_level()
+        aurora_future = self.executor.submit(self._download_aurora_data)
+        k_index_future = self.executor.submit(self._download_k_index_data)
+        try:
+            aurora_data = aurora_future.result()
+            k_time, k_index = k_index_future.result()
+            aurora_result = self._evaluate_aurora_level(aurora_data)
+        except (ConnectionError, ValueError) as error:
+            print(f'{error}; check skipped.')
+            return ''
+        k_index_result = self._evaluate_k_index_level(k_time, k_index)
         print(f'last aurora: {self.last_aurora_level}; last k-index: {self.last_k_level}; day: {self.is_day}')
         message = '\n'.join(filter(None, [aurora_result, k_index_result]))
         if message:
-            self.send_push(message)
+            self.queue_push(message)
         return message
 
-    def _evaluate_aurora_level(self) -> str | None:
+    def _evaluate_aurora_level(self, data: json) -> str | None:
         """
         Evaluates the aurora activity level for the configured location and retrieves its
         corresponding descriptive message. The method calculates the local aurora activity
-        by processing downloaded aurora data, fetching the aurora intensity for the configured
+        by processing the downloaded aurora data, fetching the aurora intensity for the configured
         longitude and latitude, and comparing it against the maximum auroral intensity found
         in the dataset.
 
+        :param data: The aurora data as returned by `_download_aurora_data`.
+        :type data: json
+
         :raises KeyError: Raised if the expected keys are not found in processed aurora data.
         :raises ValueError: Raised if aurora levels are improperly configured or invalid.
 
@@ -147,20 +309,23 @@ class Aurora:
                  predefined thresholds. Returns None if no meaningful data is available.
         :rtype: str | None
         """
-        coordinates = self._process_aurora_data(self._download_aurora_data())
-        local_level = coordinates.get((self.longitude, self.latitude), 0)
-        max_aurora = max(coordinates.values())
+        local_level, max_aurora = self._process_aurora_data(data)
         print(f'Aurora: {local_level}; Max Aurora: {max_aurora}; ', end='')
-        return self._get_message_from_levels(local_level, AURORA_LEVELS[self.language], 'last_aurora_level')
+        level, message = self._get_message_from_levels(local_level, self.aurora_levels, self.last_aurora_level)
+        self.last_aurora_level = level
+        return message
 
-    def _evaluate_k_index_level(self) -> str | None:
+    def _evaluate_k_index_level(self, k_time: str, k_index: float) -> str | None:
         """
         Evaluates the K-index level based on retrieved data and returns the respective
         message indicating the quality level (Preliminary, Provisional, Definitive).
         The K-index is used to quantify disturbances in the Earth's magnetic field
-        and provides insight into geomagnetic conditions. Data is downloaded and
+        and provides insight into geomagnetic conditions. The downloaded data is
         processed, returning a categorized message based on predefined levels.
 
+        :param k_time: The time tag of the K-index measurement.
+        :param k_index: The K-index value, as returned by `_download_k_index_data`.
+
         :return: A message string corresponding to the K-index quality level or None
             if the evaluation fails.
         :rtype: str | None
@@ -168,49 +333,186 @@ class Aurora:
         # - "P" - Preliminary (Wstępny): Wstępne dane, mogą zostać zaktualizowane.
         # - "M" - Provisional (Provisional): Tymczasowe dane, bardziej dokładne niż wstępne, ale nadal podlegające rewizji.
         # - "Z" - Definitive (Ostateczny): Ostateczne, zatwierdzone dane, uznawane za najbardziej dokładne.
-        k_time, k_index = self._download_k_index_data()
         print(f'k-index: {k_index:.1f}; k-time: {k_time}; ', end='')
-        return self._get_message_from_levels(k_index, K_INDEX_LEVELS[self.language], 'last_k_level')
+        level, message = self._get_message_from_levels(k_index, self.k_levels, self.last_k_level)
+        self.last_k_level = level
+        return message
+
+    @staticmethod
+    def _sort_levels(thresholds: list[tuple[int, str]]) -> tuple[tuple[int, ...], tuple[str, ...]]:
+        """
+        Splits the threshold pairs into ascending levels and their aligned messages.
 
-    def _get_message_from_levels(self, current_value: float | int, thresholds: tuple[int, str], last_level_var: str) -> str | None:
+        :param thresholds: A list of pairs containing a numerical level and a corresponding message.
+
+        :return: A tuple of the levels sorted ascending and the messages in the same order.
+        :rtype: tuple[tuple[int, ...], tuple[str, ...]]
+        """
+        levels, messages = zip(*sorted(thresholds))
+        return levels, messages
+
+    @staticmethod
+    def _get_message_from_levels(current_value: float | int, thresholds: tuple[tuple[int, ...], tuple[str, ...]],
+                                 last_level: int) -> tuple[int, str | None]:
         """
-        Determines the appropriate message based on the current value and threshold levels. The function
-        compares the `current_value` against each level in the `thresholds` tuple while also checking
-        and updating the `last_level_var` stored in the object. If the `current_value` matches the
-        condition for any specific level, the associated message is returned. If no levels match, the
-        function returns `None`.
+        Determines the appropriate message based on the current value and threshold levels. The highest
+        level not above `current_value` is found with a binary search. If it is higher than the
+        previously crossed `last_level`, it becomes the new level and its message is returned.
 
         :param current_value:
             The current numerical value to evaluate, which is compared against the thresholds.
         :param thresholds:
-            A tuple where each element is a pair containing a numerical level and a corresponding
-            string message.
-        :param last_level_var:
-            The attribute name within the object storing the previously crossed threshold level. This
-            value is updated if a new threshold level is crossed.
+            A pair of the ascending numerical levels and their corresponding string messages,
+            as returned by `_sort_levels`.
+        :param last_level:
+            The previously crossed threshold level.
         :return:
-            A string message if the current value crosses a new threshold level. Returns `None` if no
-            threshold is crossed.
+            A tuple of the crossed threshold level and its message if the current value crosses a new
+            threshold level. Otherwise `last_level` and `None`.
         """
-        for level, message in thresholds:
-            if current_value >= level > getattr(self, last_level_var):
-                setattr(self, last_level_var, level)
-                return message
-        return None
+        levels, messages = thresholds
+        index = bisect_right(levels, current_value) - 1
+        if index >= 0 and levels[index] > last_level:
+            return levels[index], messages[index]
+        return last_level, None
 
-    @staticmethod
-    def _download_aurora_data():
-        response = requests.get(AURORA_URL)
+    def _cached_get(self, url: str, ttl: int, name: str, tail: int = 0):
+        """
+        Downloads JSON data from the given URL, reusing the cached copy while it is fresh.
+
+        Within `ttl` seconds of the last fetch the cached data is returned without any
+        network traffic. After that a conditional GET is sent with the stored `ETag` and
+        `Last-Modified` values, so an unchanged resource costs only a 304 response.
+        If the download fails or the response cannot be parsed, the last known data is
+        returned instead (see `_fallback`).
+
+        With a positive `tail`, only the last `tail` bytes of a JSON list are requested, without
+        content encoding so that the range refers to the JSON text itself. If the server honours
+        the range, the data is a one-element list with the last complete record; otherwise the
+        full list is downloaded.
+
+        :param url: The address of the JSON resource.
+        :param ttl: Number of seconds the cached data is considered fresh.
+        :param name: Human-readable name of the data, used in error messages.
+        :param tail: Number of bytes to request from the end of the resource, or 0 for all of it.
+
+        :raises ConnectionError: If the HTTP request fails and no earlier data is available.
+
+        :return: The parsed JSON data.
+        """
+        now = self.clock.now
+        timestamp, etag, last_modified, data = self.cache.get(url, (0, None, None, None))
+        if data is not None and now - timestamp < ttl:
+            return data
+        headers = {}
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+        try:
+            if tail > 0:
+                range_headers = {**headers, 'Range': f'bytes=-{tail}', 'Accept-Encoding': 'identity'}
+                response = self.session.get(url, headers=range_headers, timeout=TIMEOUT)
+                if response.status_code == 416:
+                    response = self.session.get(url, headers=headers, timeout=TIMEOUT)
+            else:
+                response = self.session.get(url, headers=headers, timeout=TIMEOUT)
+        except requests.RequestException as error:
+            return self._fallback(url, data, f'Error downloading {name}: {error}')
+        if response.status_code == 304 and data is not None:
+            self.cache[url] = (now, etag, last_modified, data)
+            return data
         if response.ok:
-            return response.json()
-        raise ConnectionError(f'Error downloading aurora data: {response.status_code}, {response.content}')
+            content = response.content
+            try:
+                if response.status_code == 206:
+                    content = self._last_record(content)
+                data = json_loads(content)
+            except ValueError as error:
+                return self._fallback(url, data, f'Error parsing {name}: {error}')
+            self.cache[url] = (now, response.headers.get('ETag'), response.headers.get('Last-Modified'), data)
+            self._save_file(self._last_copy_path(url), content)
+            return data
+        return self._fallback(url, data, f'Error downloading {name}: {response.status_code}, {response.content}')
 
     @staticmethod
-    def _download_k_index_data():
+    def _last_record(content: bytes) -> bytes:
+        """
+        Extracts the last complete record from the tail of a JSON list of flat objects.
+
+        :param content: The last bytes of the JSON list.
+
+        :raises ValueError: If the content does not contain a complete record.
+
+        :return: A JSON list containing only the last record.
+        :rtype: bytes
+        """
+        start = content.rindex(b'{')
+        end = content.index(b'}', start) + 1
+        return b'[' + content[start:end] + b']'
+
+    def _fallback(self, url: str, data, error: str):
+        """
+        Returns the last known data for the given URL after a failed download.
+
+        The in-memory copy is used if there is one. Otherwise the copy saved on disk
+        by `_cached_get` is loaded, so the monitor keeps working across restarts
+        during NOAA outages.
+
+        :param url: The address of the JSON resource.
+        :param data: The data cached in memory, or None.
+        :param error: Description of the failure.
+
+        :raises ConnectionError: If no earlier data is available.
+
+        :return: The last known parsed JSON data.
+        """
+        if data is None:
+            try:
+                with open(self._last_copy_path(url), 'rb') as file:
+                    data = json_loads(file.read())
+            except (OSError, ValueError):
+                raise ConnectionError(error)
+            self.cache[url] = (float('-inf'), None, None, data)
+        print(f'{error}; using last known data. ', end='')
+        return data
+
+    @staticmethod
+    def _save_file(path: str, content: bytes) -> None:
+        """
+        Saves the content to the given path in `CACHE_DIR`.
+
+        The file is written to a temporary path first and then moved into place, so a
+        crash never leaves a partially written file behind.
+
+        :param path: The destination path.
+        :param content: The bytes to write.
+
+        :return: None
+        """
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            with open(f'{path}.tmp', 'wb') as file:
+                file.write(content)
+            os.replace(f'{path}.tmp', path)
+        except OSError as error:
+            print(f'Error saving {path}: {error}; ', end='')
+
+    @staticmethod
+    def _last_copy_path(url: str) -> str:
+        """Return the path of the on-disk copy of the given URL."""
+        return os.path.join(CACHE_DIR, url.rsplit('/', 1)[-1])
+
+    def _download_aurora_data(self):
+        return self._cached_get(AURORA_URL, AURORA_TTL, 'aurora data')
+
+    def _download_k_index_data(self):
         """
         Downloads the latest K-index data from a predefined URL and extracts the most
         recent time tag and Kp index value. The function performs a GET request to fetch
         data and processes the response, ensuring that it retrieves valid information.
+        Only the last `K_INDEX_TAIL` bytes are requested, and responses are cached for
+        `K_INDEX_TTL` seconds.
 
         :raises ConnectionError: If the HTTP request fails or the response is invalid.
 
@@ -218,13 +520,10 @@ class Aurora:
             and the corresponding `kp_index` as a float.
         :rtype: tuple[str, float]
         """
-        response = requests.get(K_INDEX_URL)
-        if response.ok:
-            data = response.json()[-1]
-            k_time = data.get('time_tag', '').replace('T', ' ')
-            k_index = data.get('kp_index', 0.0)
-            return k_time, k_index
-        raise ConnectionError(f'Error downloading K-index data: {response.status_code}, {response.content}')
+        data = self._cached_get(K_INDEX_URL, K_INDEX_TTL, 'K-index data', K_INDEX_TAIL)[-1]
+        k_time = data.get('time_tag', '').replace('T', ' ')
+        k_index = data.get('kp_index', 0.0)
+        return k_time, k_index
 
     @property
     def is_daytime(self):
@@ -233,91 +532,225 @@ class Aurora:
 
         This property checks if the current time is within the predefined
         `START_DAY` and `END_DAY` time boundaries. Daytime is specified by
-        these global time constants.
+        these global constants in seconds since midnight.
 
         :return: A boolean value indicating whether the current time is within
             the daytime range.
         :rtype: bool
         """
-        current_time = datetime.datetime.now().time()
-        return START_DAY <= current_time <= END_DAY
+        return START_DAY <= self._seconds_since_midnight() <= END_DAY
 
-    @staticmethod
-    def _process_aurora_data(data: json):
+    def _process_aurora_data(self, data: json) -> tuple[int, int]:
         """
-        Processes aurora data from the provided JSON format into a sorted dictionary.
+        Finds the aurora value for the monitored location and the maximum aurora value in the data.
 
-        This method extracts `coordinates` data from the JSON input and maps it into a dictionary where the
-        keys are tuples of longitude and latitude, and the values are the corresponding aurora values.
-        The resulting dictionary is then sorted based on the keys.
+        The `coordinates` data from the JSON input is converted to a NumPy array of
+        (longitude, latitude, aurora) rows and scanned once. The result is reused as long as
+        the same JSON object is passed in, which is the case while the download is served
+        from cache.
 
         :param data: A JSON object containing aurora data with 'coordinates' as a key. The value of
                      'coordinates' is expected to be a list of tuples, where each tuple consists of
                      longitude, latitude, and aurora values.
         :type data: json
 
-        :return: A sorted dictionary where keys are tuples of longitude and latitude, and values
-                 are the aurora values.
-        :rtype: dict
+        :return: A tuple of the local aurora value (0 if the location is missing) and the maximum
+                 aurora value.
+        :rtype: tuple[int, int]
 
         :raises ValueError: If the `coordinates` data is unavailable or empty in the provided JSON.
         """
-        coordinates = {(lon, lat): aurora for lon, lat, aurora in data.get('coordinates', [])}
+        if self.aurora_result is not None and self.aurora_result[0] is data:
+            return self.aurora_result[1]
+        coordinates = data.get('coordinates')
         if not coordinates:
             raise ValueError("No aurora data available.")
-        return dict(sorted(coordinates.items()))
+        grid = np.asarray(coordinates, dtype=np.int32)
+        longitude, latitude = self.location
+        max_aurora = int(grid[:, 2].max())
+        mask = (grid[:, 0] == longitude) & (grid[:, 1] == latitude)
+        local_level = int(grid[mask, 2][0]) if mask.any() else 0
+        self.aurora_result = (data, (local_level, max_aurora))
+        return local_level, max_aurora
 
     def reset(self):
-        """Reset tracked aurora and K-index levels."""
+        """Reset tracked aurora and K-index levels and drop queued messages."""
         self.last_aurora_level = 0
         self.last_k_level = 0
+        self.pending_messages.clear()
+        self.save_state()
+
+    def queue_push(self, message: str) -> None:
+        """
+        Queues a message and (re)arms the push event to send it after `PUSH_DEBOUNCE` seconds.
+
+        Messages queued within the debounce period are coalesced by `flush_push` into a single
+        push notification. A message already in the queue is not added again, and only the
+        newest `PUSH_QUEUE_LIMIT` messages are kept.
+
+        :param message: The message to be sent as the push notification.
+
+        :return: None
+        """
+        if message not in self.pending_messages:
+            self.pending_messages.append(message)
+            del self.pending_messages[:-PUSH_QUEUE_LIMIT]
+        self.clock.add(PUSH_EVENT, self.flush_push, PUSH_DEBOUNCE)
+
+    def flush_push(self):
+        """
+        Sends all queued messages as one push notification and disarms the push event.
+
+        The queue is cleared once the notification has been sent, was already sent as a
+        duplicate, or was rejected with a client error (4xx other than 429), which retrying
+        would not fix. If it was suppressed by the rate limit or the request failed otherwise,
+        the messages stay queued and the push event is rearmed after `PUSH_RETRY_DELAY` seconds
+        or when the cooldown ends, whichever is later.
+
+        :return: The result of `send_push`, or None if no message was sent.
+        :rtype: requests.Response | None
+        """
+        self.clock.remove(PUSH_EVENT)
+        message = '\n'.join(self.pending_messages)
+        if not message:
+            return None
+        rejected = False
+        try:
+            response = self.send_push(message)
+        except ConnectionError as error:
+            print(f'Push failed: {error}')
+            response = None
+            rejected = bool(error.args) and isinstance(error.args[0], int) and 400 <= error.args[0] < 500
+        if response is not None or rejected or self._is_duplicate(message, time.time()):
+            self.pending_messages.clear()
+        else:
+            delay = max(PUSH_RETRY_DELAY, self.push_cooldown_until - self.clock.now)
+            self.clock.add(PUSH_EVENT, self.flush_push, delay)
+        return response
+
+    def _is_duplicate(self, message: str, send_time: float) -> bool:
+        """Return whether the message was sent within the last `DEDUP_WINDOW` seconds."""
+        return send_time - self.recent_messages.get(message, 0) < DEDUP_WINDOW
 
     def send_push(self, message: str):
         """
         Sends a push notification message to the specified user using configured API credentials.
 
         This method constructs a payload containing the API key, user key, and the notification
-        message to send it via an HTTP POST request. The required headers and content type
-        are included in the request. If the message is successfully sent, the time of the last
-        successful send is updated. If the request fails, a `ConnectionError` is raised with
-        the response's status code and content.
+        message to send it as a form-encoded HTTP POST request. If the message is successfully
+        sent, the time of the last successful send is updated and the state is saved (see
+        `save_state`). If the request fails, a `ConnectionError` is raised with the response's
+        status code and content.
+
+        Pushover rate limits are respected: no more than `PUSH_RATE_LIMIT` messages are sent within
+        `PUSH_RATE_WINDOW` seconds, a 429 response starts a cooldown taken from its `Retry-After`
+        header, and sending stops once `X-Limit-App-Remaining` reports that the quota is used up.
+        A message identical to one sent within the last `DEDUP_WINDOW` seconds is not sent again.
 
         :param message: The message to be sent as the push notification.
 
         :return: The HTTP response object from the push notification API request, if the notification
-                 has been sent successfully.
-        :rtype: requests.Response
+                 has been sent successfully, or None if it was suppressed by the rate limit, as
+                 a duplicate, rejected with a 429 response, or the request timed out or could not
+                 connect.
+        :rtype: requests.Response | None
         :raises ConnectionError: If the request to the push notification API fails, the response status
                                  code and content are included in the exception.
         """
+        now = self.clock.now
+        while self.push_times and now - self.push_times[0] >= PUSH_RATE_WINDOW:
+            self.push_times.popleft()
+        if now < self.push_cooldown_until:
+            print(f'Push suppressed: rate limited for {self.push_cooldown_until - now:.0f} s')
+            return None
+        if len(self.push_times) >= PUSH_RATE_LIMIT:
+            print(f'Push suppressed: {PUSH_RATE_LIMIT} messages sent within {PUSH_RATE_WINDOW} s')
+            return None
+        send_time = time.time()
+        if self._is_duplicate(message, send_time):
+            print(f'Push suppressed: same message sent within {DEDUP_WINDOW} s')
+            return None
         payload = {
             'token': self.api_key,
             'user': self.user_key,
-            'message': message,
-            'Content-type': 'application/x-www-form-urlencoded'
+            'message': message
         }
-        response = requests.post(PUSH_URL, headers=HEADERS, data=payload)
+        try:
+            response = self.session.post(PUSH_URL, data=payload, timeout=TIMEOUT)
+        except requests.RequestException as error:
+            print(f'Push failed: {error}')
+            return None
+        if response.status_code == 429:
+            retry_after = self._retry_after(response.headers.get('Retry-After'), send_time)
+            self.push_cooldown_until = now + retry_after
+            print(f'Push suppressed: rate limited by Pushover for {retry_after:.0f} s')
+            return None
         if response.ok:
-            self.last_send_time = self.clock.now
+            self.last_send_time = send_time
+            self.push_times.append(now)
+            self.recent_messages = {text: sent for text, sent in self.recent_messages.items()
+                                    if send_time - sent < DEDUP_WINDOW}
+            self.recent_messages[message] = send_time
+            self.save_state()
+            if self._int_header(response.headers, 'X-Limit-App-Remaining', 1) <= 0:
+                reset_time = self._int_header(response.headers, 'X-Limit-App-Reset', 0)
+                self.push_cooldown_until = max(reset_time - send_time, SEND_DELAY) + now
             return response
         raise ConnectionError(response.status_code, response.content)
 
+    @staticmethod
+    def _int_header(headers, name: str, default: int) -> int:
+        """Return the header as an integer, or `default` if it is missing or invalid."""
+        try:
+            return int(headers.get(name, default))
+        except (TypeError, ValueError):
+            return default
+
+    @staticmethod
+    def _retry_after(value: str | None, send_time: float) -> float:
+        """
+        Parses a `Retry-After` header given either in seconds or as an HTTP date.
+
+        :param value: The header value, or None if the header is missing.
+        :param send_time: The Unix timestamp of the request, used for HTTP dates.
+
+        :return: The number of seconds to wait, or `PUSH_RATE_WINDOW` if the value is missing
+            or invalid.
+        :rtype: float
+        """
+        if value:
+            try:
+                return max(float(value), 0)
+            except ValueError:
+                pass
+            try:
+                return max(parsedate_to_datetime(value).timestamp() - send_time, 0)
+            except (TypeError, ValueError):
+                pass
+        return PUSH_RATE_WINDOW
+
     def start_loop(self):
         """
         Initiates the main loop for orchestrating and managing periodic events. This method
         uses a clock to schedule recurring events, such as checking and resetting processes,
         while dynamically updating the delay based on the time of day. The loop continues
-        indefinitely, ensuring that all events are executed in a defined sequence and at
-        appropriate intervals.
+        indefinitely, sleeping until the next scheduled event is due. If a notification was
+        sent before a restart, the first reset follows the reset period from its send time.
 
         :param self: Represents the instance of the class.
         :return: None
         """
         self.clock.add(CHECK_EVENT, self.check, CHECK_DELAY)
-        self.clock.add(RESET_EVENT, self.reset, SEND_DELAY)
+        self.is_day = self.is_daytime
+        reset_delay = self._reset_delay(self.is_day)
+        first_reset_delay = reset_delay
+        if self.last_send_time:
+            first_reset_delay = max(SECOND, self.last_send_time + reset_delay - time.time())
+        self.clock.add(RESET_EVENT, self.reset, reset_delay, first_reset_delay)
+        self.clock.add(DAYTIME_EVENT, self.update_daytime_delay, self._seconds_to_daytime_change())
         self.update_daytime_delay()
         self.check()
         while True:
             self.clock.make_step()
-            self.update_daytime_delay()
-            time.sleep(3)
+            deadline = self.clock.next_deadline()
+            time.sleep(CHECK_DELAY if deadline is None else max(MIN_SLEEP, deadline - self.clock.now))
@@ -1,3 +1,4 @@
+import heapq
 import time
 
 
@@ -8,20 +9,24 @@ class Clock:
     The Clock class provides functionalities to add, schedule, execute, and remove
     events. Events are identified by unique integers and are associated with
     callback functions and delays. The clock tracks events internally using a
-    dictionary. Users can also retrieve the current Unix timestamp via the `now`
-    property.
+    dictionary and a min-heap ordered by execution time, so due events are found
+    without scanning all of them. Users can also retrieve the current time via the
+    `now` property. It is monotonic, so NTP corrections and DST changes do not
+    affect the schedule.
 
     :ivar events: A dictionary storing scheduled events. Keys are integers
-        representing event IDs, and values are dictionaries containing event
-        details such as the callback function, next execution time, and delay.
-    :type events: dict[int, dict[str, any]]
+        representing event IDs, and values are tuples of the next execution time,
+        the callback function, and the delay, in `EVENT_TIMER_FIELD_NAMES` order.
+    :type events: dict[int, tuple[float, callable, int]]
     """
+    __slots__ = ('events', '_heap')
     EVENT_TIMER_FIELD_NAMES = ['timer', 'function', 'delay']
 
     def __init__(self):
-        self.events: dict[int, dict[str, any]] = {}
+        self.events: dict[int, tuple[float, callable, int]] = {}
+        self._heap: list[tuple[float, int]] = []
 
-    def add(self, event: int, callback: callable, delay: int) -> None:
+    def add(self, event: int, callback: callable, delay: int, first_delay: float | None = None) -> None:
         """
         Adds an event to the event scheduler. The event is associated with a specific
         callback function to be executed after a defined delay.
@@ -29,15 +34,13 @@ class Clock:
         :param event: The identifier for the event to add.
         :param callback: The function to be executed when the event occurs.
         :param delay: The delay in seconds before the event is triggered.
+        :param first_delay: The delay in seconds before the first execution only, if it
+            differs from `delay`. Later executions follow `delay`.
 
         :return: None
         """
-        next_execution_time = self._calculate_next_execution_time(delay)
-        self.events[event] = {
-            'timer': next_execution_time,
-            'function': callback,
-            'delay': delay
-        }
+        first_delay = delay if first_delay is None else first_delay
+        self._schedule(event, callback, delay, self._calculate_next_execution_time(first_delay))
 
     def set(self, event: int, delay: int) -> None:
         """
@@ -49,18 +52,18 @@ class Clock:
 
         :returns: None
         """
-        next_execution_time = self._calculate_next_execution_time(delay)
-        self.events[event]['delay'] = delay
-        self.events[event]['timer'] = next_execution_time
+        callback = self.events[event][1]
+        self._schedule(event, callback, delay, self._calculate_next_execution_time(delay))
 
     def make_step(self) -> dict[int, any]:
         """
         Executes scheduled events if their timers expired and updates their timers.
 
-        This method iterates through the scheduled events dictionary. If the event's
-        execution time has been reached or passed, it executes the associated callback
-        function. The timer for the event is then updated by adding the delay interval.
-        Results of executed events (if any) are collected and returned.
+        This method pops the due events from the heap. For each of them it executes
+        the associated callback function and schedules the event again after its
+        delay interval, unless the callback has already rescheduled it. Heap entries
+        left behind by `set` or `remove` are skipped. Results of executed events
+        (if any) are collected and returned.
 
         :returns:
             A dictionary where keys are event IDs and values are the results of
@@ -70,29 +73,47 @@ class Clock:
         results = {}
         current_time = self.now
 
-        for event_id, event_data in self.events.items():
-            next_execution_time = event_data['timer']
-            callback = event_data['function']
-            delay = event_data['delay']
-
-            if 0 < next_execution_time < current_time:
-                results[event_id] = callback()
-                event_data['timer'] = current_time + delay
+        while self._heap and self._heap[0][0] <= current_time:
+            next_execution_time, event_id = heapq.heappop(self._heap)
+            event_data = self.events.get(event_id)
+            if event_data is None or event_data[0] != next_execution_time:
+                continue
+            _, callback, delay = event_data
+            results[event_id] = callback()
+            if self.events.get(event_id) is event_data:
+                self._schedule(event_id, callback, delay, current_time + delay)
 
         return results
 
+    def next_deadline(self) -> float | None:
+        """
+        Returns the earliest execution time among the scheduled events.
+
+        Events with a disabled timer (0) are ignored. This allows the caller to sleep
+        until the next event is due instead of polling the clock.
+
+        :return: The `now` time of the next event to execute, or None if no event is scheduled.
+        """
+        while self._heap:
+            next_execution_time, event_id = self._heap[0]
+            event_data = self.events.get(event_id)
+            if event_data is not None and event_data[0] == next_execution_time:
+                return next_execution_time
+            heapq.heappop(self._heap)
+        return None
+
     @property
-    def now(self) -> int:
+    def now(self) -> float:
         """
-        Provides the current Unix timestamp.
+        Provides the current monotonic time.
 
-        The `now` property retrieves the current time as a Unix timestamp,
-        represented as an integer. This timestamp represents the number of seconds
-        that have elapsed since 00:00:00 UTC on 1 January 1970.
+        The `now` property retrieves the value of a clock that cannot go backwards,
+        in fractional seconds. Only the difference between two values is meaningful;
+        it is not related to the Unix timestamp.
 
-        :return: The current Unix timestamp as an integer.
+        :return: The current monotonic time in seconds.
         """
-        return int(time.time())
+        return time.monotonic()
 
     def remove(self, event: int) -> None:
         """
@@ -108,7 +129,25 @@ class Clock:
         """
         self.events.pop(event, None)
 
-    def _calculate_next_execution_time(self, delay: int) -> int:
+    def _schedule(self, event: int, callback: callable, delay: int, next_execution_time: float) -> None:
+        """
+        Stores the event details and pushes its execution time onto the heap.
+
+        Events with a disabled timer (0) are stored but never pushed, so they do not
+        execute until they are scheduled again with a positive delay.
+
+        :param event: The identifier for the event.
+        :param callback: The function to be executed when the event occurs.
+        :param delay: The delay in seconds between executions.
+        :param next_execution_time: The `now` time of the next execution, or 0 if disabled.
+
+        :return: None
+        """
+        self.events[event] = (next_execution_time, callback, delay)
+        if next_execution_time > 0:
+            heapq.heappush(self._heap, (next_execution_time, event))
+
+    def _calculate_next_execution_time(self, delay: float) -> float:
         """
         Calculate and return the next execution time based on the given delay.
 
@@ -118,7 +157,7 @@ class Clock:
 
         :param delay: The delay in seconds to calculate the next execution time.
 
-        :return: The calculated timestamp for the next execution or 0 if the delay
+        :return: The calculated `now` time for the next execution or 0 if the delay
             is non-positive.
         """
         return self.now + delay if delay > 0 else 0